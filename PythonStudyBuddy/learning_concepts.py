@@ -5,9 +5,13 @@ This module contains dataclass models for representing learning concepts,
 challenges, and educational content at different skill levels.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Literal
+import pickle
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from typing import AbstractSet, Any, ClassVar, Iterable, List, Dict, Optional, Literal, Tuple, Union
 from enum import Enum
+from pathlib import Path
 
 
 class SkillLevel(Enum):
@@ -32,6 +36,54 @@ class ConceptCategory(Enum):
     ASYNC = "asynchronous_programming"
 
 
+def _as_set(items: Iterable[str]) -> AbstractSet[str]:
+    """Return items as a set for O(1) membership checks, copying only if needed."""
+    if isinstance(items, (set, frozenset)):
+        return items
+    return set(items)
+
+
+def _move_in_index(index: Dict[Any, Dict[str, None]], old_key: Any, new_key: Any,
+                   item_id: str, order: Iterable[str]) -> None:
+    """Move an id between index buckets, keeping the new bucket in `order`."""
+    if new_key is old_key:
+        return
+    index[old_key].pop(item_id, None)
+    bucket = index[new_key]
+    bucket[item_id] = None
+    index[new_key] = {other_id: None for other_id in order if other_id in bucket}
+
+
+class _DictMixin:
+    """Base for models that convert to dicts using field names cached on the class."""
+    __slots__ = ()
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict like dataclasses.asdict, without per-call field introspection."""
+        return {name: _to_plain(getattr(self, name)) for name in self._field_names}
+
+
+def _with_cached_fields(cls):
+    """Cache a dataclass's field names on the class for to_dict()."""
+    cls._field_names = tuple(f.name for f in fields(cls))
+    return cls
+
+
+def _to_plain(value: Any) -> Any:
+    """Recursively convert nested models and containers for to_dict()."""
+    if isinstance(value, _DictMixin):
+        return value.to_dict()
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # namedtuples take positional arguments rather than an iterable
+        return type(value)(*[_to_plain(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_plain(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    return value
+
+
 class ChallengeType(Enum):
     """Types of coding challenges."""
     MULTIPLE_CHOICE = "multiple_choice"
@@ -41,8 +93,9 @@ class ChallengeType(Enum):
     EXPLAIN_CODE = "explain_code"
 
 
-@dataclass
-class CodeExample:
+@_with_cached_fields
+@dataclass(frozen=True, slots=True)
+class CodeExample(_DictMixin):
     """Represents a code example with explanation."""
     code: str
     explanation: str
@@ -50,8 +103,9 @@ class CodeExample:
     is_runnable: bool = True
 
 
-@dataclass
-class Challenge:
+@_with_cached_fields
+@dataclass(frozen=True, slots=True)
+class Challenge(_DictMixin):
     """Represents a coding challenge for learning."""
     id: str
     title: str
@@ -64,38 +118,47 @@ class Challenge:
     test_cases: List[Dict[str, str]] = field(default_factory=list)
     points: int = 10
     time_limit_minutes: Optional[int] = None
+    
+    def __post_init__(self):
+        """Intern the challenge ID for faster dictionary lookups."""
+        object.__setattr__(self, "id", sys.intern(self.id))
 
 
-@dataclass
-class LearningConcept:
+@_with_cached_fields
+@dataclass(frozen=True, slots=True)
+class LearningConcept(_DictMixin):
     """Represents a single learning concept with educational content."""
     id: str
     name: str
     category: ConceptCategory
     skill_level: SkillLevel
     description: str
-    learning_objectives: List[str]
+    learning_objectives: Tuple[str, ...]
     explanation: str
     code_examples: List[CodeExample] = field(default_factory=list)
     challenges: List[Challenge] = field(default_factory=list)
     prerequisites: List[str] = field(default_factory=list)
     next_concepts: List[str] = field(default_factory=list)
     estimated_duration_minutes: int = 30
-    keywords: List[str] = field(default_factory=list)
+    keywords: Tuple[str, ...] = ()
     resources: List[str] = field(default_factory=list)
     
     def __post_init__(self):
         """Validate the learning concept after initialization."""
-        if not self.name.strip():
+        object.__setattr__(self, "id", sys.intern(self.id))
+        object.__setattr__(self, "learning_objectives", tuple(self.learning_objectives))
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        if not self.name or self.name.isspace():
             raise ValueError("Learning concept name cannot be empty")
-        if not self.description.strip():
+        if not self.description or self.description.isspace():
             raise ValueError("Learning concept description cannot be empty")
         if self.estimated_duration_minutes <= 0:
             raise ValueError("Estimated duration must be positive")
 
 
-@dataclass
-class ConceptProgress:
+@_with_cached_fields
+@dataclass(slots=True)
+class ConceptProgress(_DictMixin):
     """Tracks user progress on a specific concept."""
     concept_id: str
     is_completed: bool = False
@@ -107,30 +170,39 @@ class ConceptProgress:
     mastery_level: float = 0.0  # 0.0 to 1.0
 
 
-@dataclass
-class LearningPath:
+@_with_cached_fields
+@dataclass(frozen=True, slots=True)
+class LearningPath(_DictMixin):
     """Represents a structured learning path for a skill level."""
     id: str
     name: str
     skill_level: SkillLevel
     description: str
-    concept_ids: List[str]
+    concept_ids: Tuple[str, ...]
     estimated_total_hours: int
-    prerequisites: List[str] = field(default_factory=list)
+    prerequisites: Tuple[str, ...] = ()
     
-    def get_next_concept(self, completed_concepts: List[str]) -> Optional[str]:
+    def __post_init__(self):
+        """Intern the path ID and freeze ID sequences passed as lists."""
+        object.__setattr__(self, "id", sys.intern(self.id))
+        object.__setattr__(self, "concept_ids", tuple(self.concept_ids))
+        object.__setattr__(self, "prerequisites", tuple(self.prerequisites))
+    
+    def get_next_concept(self, completed_concepts: Iterable[str]) -> Optional[str]:
         """Get the next concept to study based on completed concepts."""
+        completed = _as_set(completed_concepts)
         for concept_id in self.concept_ids:
-            if concept_id not in completed_concepts:
+            if concept_id not in completed:
                 return concept_id
         return None
     
-    def get_progress_percentage(self, completed_concepts: List[str]) -> float:
+    def get_progress_percentage(self, completed_concepts: Iterable[str]) -> float:
         """Calculate progress percentage for this learning path."""
         if not self.concept_ids:
             return 0.0
+        completed = _as_set(completed_concepts)
         completed_count = sum(1 for concept_id in self.concept_ids 
-                            if concept_id in completed_concepts)
+                            if concept_id in completed)
         return (completed_count / len(self.concept_ids)) * 100
 
 
@@ -140,10 +212,51 @@ class ConceptRepository:
     def __init__(self):
         self.concepts: Dict[str, LearningConcept] = {}
         self.learning_paths: Dict[str, LearningPath] = {}
+        # Secondary indexes (id -> None dicts act as insertion-ordered sets)
+        self._by_level: Dict[SkillLevel, Dict[str, None]] = defaultdict(dict)
+        self._by_category: Dict[ConceptCategory, Dict[str, None]] = defaultdict(dict)
+        self._paths_by_level: Dict[SkillLevel, Dict[str, None]] = defaultdict(dict)
+        # Lowercased name, description and keywords per concept for search
+        self._search_text: Dict[str, str] = {}
     
     def add_concept(self, concept: LearningConcept) -> None:
         """Add a learning concept to the repository."""
-        self.concepts[concept.id] = concept
+        concept_id = sys.intern(concept.id)
+        previous = self.concepts.get(concept_id)
+        self.concepts[concept_id] = concept
+        if previous is None:
+            self._index_concept(concept_id, concept)
+        else:
+            self._reindex_concept(concept_id, previous, concept)
+    
+    def _index_concept(self, concept_id: str, concept: LearningConcept) -> None:
+        """Add a newly stored concept to the secondary indexes."""
+        self._by_level[concept.skill_level][concept_id] = None
+        self._by_category[concept.category][concept_id] = None
+        self._search_text[concept_id] = self._concept_search_text(concept)
+    
+    def _reindex_concept(self, concept_id: str, previous: LearningConcept,
+                         concept: LearningConcept) -> None:
+        """Update index entries for a replaced concept, keeping its position."""
+        _move_in_index(self._by_level, previous.skill_level, concept.skill_level,
+                       concept_id, self.concepts)
+        _move_in_index(self._by_category, previous.category, concept.category,
+                       concept_id, self.concepts)
+        self._search_text[concept_id] = self._concept_search_text(concept)
+    
+    @staticmethod
+    def _concept_search_text(concept: LearningConcept) -> str:
+        """Lowercased name, description and keywords joined for substring search."""
+        return "\0".join([concept.name, concept.description, *concept.keywords]).lower()
+    
+    def remove_concept(self, concept_id: str) -> Optional[LearningConcept]:
+        """Remove a learning concept from the repository and return it."""
+        concept = self.concepts.pop(concept_id, None)
+        if concept is not None:
+            self._by_level[concept.skill_level].pop(concept_id, None)
+            self._by_category[concept.category].pop(concept_id, None)
+            self._search_text.pop(concept_id, None)
+        return concept
     
     def get_concept(self, concept_id: str) -> Optional[LearningConcept]:
         """Get a learning concept by ID."""
@@ -151,22 +264,27 @@ class ConceptRepository:
     
     def get_concepts_by_level(self, skill_level: SkillLevel) -> List[LearningConcept]:
         """Get all concepts for a specific skill level."""
-        return [concept for concept in self.concepts.values() 
-                if concept.skill_level == skill_level]
+        return [self.concepts[concept_id] for concept_id in self._by_level.get(skill_level, ())]
     
     def get_concepts_by_category(self, category: ConceptCategory, 
                                skill_level: Optional[SkillLevel] = None) -> List[LearningConcept]:
         """Get concepts by category, optionally filtered by skill level."""
-        concepts = [concept for concept in self.concepts.values() 
-                   if concept.category == category]
-        if skill_level:
-            concepts = [concept for concept in concepts 
-                       if concept.skill_level == skill_level]
-        return concepts
+        concept_ids = self._by_category.get(category, {})
+        if skill_level is None:
+            return [self.concepts[concept_id] for concept_id in concept_ids]
+        level_ids = self._by_level.get(skill_level, {})
+        return [self.concepts[concept_id] for concept_id in concept_ids if concept_id in level_ids]
     
     def add_learning_path(self, learning_path: LearningPath) -> None:
         """Add a learning path to the repository."""
-        self.learning_paths[learning_path.id] = learning_path
+        path_id = learning_path.id
+        previous = self.learning_paths.get(path_id)
+        self.learning_paths[path_id] = learning_path
+        if previous is None:
+            self._paths_by_level[learning_path.skill_level][path_id] = None
+        else:
+            _move_in_index(self._paths_by_level, previous.skill_level, learning_path.skill_level,
+                           path_id, self.learning_paths)
     
     def get_learning_path(self, path_id: str) -> Optional[LearningPath]:
         """Get a learning path by ID."""
@@ -174,21 +292,37 @@ class ConceptRepository:
     
     def get_learning_paths_by_level(self, skill_level: SkillLevel) -> List[LearningPath]:
         """Get all learning paths for a specific skill level."""
-        return [path for path in self.learning_paths.values() 
-                if path.skill_level == skill_level]
+        return [self.learning_paths[path_id] for path_id in self._paths_by_level.get(skill_level, ())]
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Write a pickle snapshot of all concepts and learning paths."""
+        with Path(path).open("wb") as f:
+            pickle.dump((self.concepts, self.learning_paths), f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ConceptRepository":
+        """Load a repository from a snapshot written by save().
+        
+        Concepts are restored without re-running construction and validation;
+        the secondary indexes are rebuilt in a single pass.
+        
+        Only load trusted snapshots written by save(): unpickling a crafted
+        file can execute arbitrary code.
+        """
+        with Path(path).open("rb") as f:
+            concepts, learning_paths = pickle.load(f)
+        repo = cls()
+        for concept in concepts.values():
+            repo.add_concept(concept)
+        for learning_path in learning_paths.values():
+            repo.add_learning_path(learning_path)
+        return repo
     
     def search_concepts(self, query: str) -> List[LearningConcept]:
         """Search concepts by name, description, or keywords."""
         query_lower = query.lower()
-        results = []
-        
-        for concept in self.concepts.values():
-            if (query_lower in concept.name.lower() or 
-                query_lower in concept.description.lower() or 
-                any(query_lower in keyword.lower() for keyword in concept.keywords)):
-                results.append(concept)
-        
-        return results
+        return [self.concepts[concept_id] for concept_id, text in self._search_text.items()
+                if query_lower in text]
 
 
 def create_sample_concepts() -> ConceptRepository:
@@ -202,11 +336,11 @@ def create_sample_concepts() -> ConceptRepository:
         category=ConceptCategory.BASICS,
         skill_level=SkillLevel.BEGINNER,
         description="Learn about Python variables and basic data types",
-        learning_objectives=[
+        learning_objectives=(
             "Understand what variables are and how to create them",
             "Learn about basic data types: int, float, str, bool",
             "Practice variable assignment and naming conventions"
-        ],
+        ),
         explanation="""
         Variables in Python are containers for storing data values. Python has no command 
         for declaring a variable - you create one by assigning a value to it.
@@ -236,7 +370,7 @@ def create_sample_concepts() -> ConceptRepository:
                 points=15
             )
         ],
-        keywords=["variables", "data types", "assignment", "int", "float", "str", "bool"],
+        keywords=("variables", "data types", "assignment", "int", "float", "str", "bool"),
         estimated_duration_minutes=45
     )
     
@@ -248,7 +382,7 @@ def create_sample_concepts() -> ConceptRepository:
         name="Python Fundamentals",
         skill_level=SkillLevel.BEGINNER,
         description="Complete introduction to Python programming",
-        concept_ids=["python_variables_beginner"],
+        concept_ids=("python_variables_beginner",),
         estimated_total_hours=20
     )
     
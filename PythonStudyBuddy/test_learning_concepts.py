@@ -0,0 +1,154 @@
+"""Tests for the learning concept models and ConceptRepository."""
+
+import dataclasses
+import json
+
+import pytest
+
+from learning_concepts import (
+    ConceptCategory,
+    ConceptRepository,
+    LearningConcept,
+    LearningPath,
+    SkillLevel,
+    create_sample_concepts,
+)
+
+
+def make_concept(concept_id: str, skill_level: SkillLevel = SkillLevel.BEGINNER,
+                 category: ConceptCategory = ConceptCategory.BASICS, **kwargs) -> LearningConcept:
+    """Build a minimal valid concept for repository tests."""
+    return LearningConcept(
+        id=concept_id,
+        name=kwargs.pop("name", f"Concept {concept_id}"),
+        category=category,
+        skill_level=skill_level,
+        description=kwargs.pop("description", f"About {concept_id}"),
+        learning_objectives=["Learn it"],
+        explanation="Explanation",
+        **kwargs,
+    )
+
+
+def ids(concepts) -> list:
+    return [concept.id for concept in concepts]
+
+
+def test_indexed_concept_cannot_be_mutated():
+    repo = ConceptRepository()
+    concept = make_concept("a")
+    repo.add_concept(concept)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        concept.skill_level = SkillLevel.EXPERT
+
+    assert ids(repo.get_concepts_by_level(SkillLevel.BEGINNER)) == ["a"]
+
+
+def test_replace_concept_with_new_level_then_remove():
+    repo = ConceptRepository()
+    repo.add_concept(make_concept("a"))
+    repo.add_concept(make_concept("a", SkillLevel.EXPERT, ConceptCategory.OOP))
+
+    assert repo.get_concepts_by_level(SkillLevel.BEGINNER) == []
+    assert ids(repo.get_concepts_by_level(SkillLevel.EXPERT)) == ["a"]
+    assert ids(repo.get_concepts_by_category(ConceptCategory.OOP, SkillLevel.EXPERT)) == ["a"]
+
+    removed = repo.remove_concept("a")
+
+    assert removed.skill_level is SkillLevel.EXPERT
+    assert repo.get_concepts_by_level(SkillLevel.BEGINNER) == []
+    assert repo.get_concepts_by_level(SkillLevel.EXPERT) == []
+    assert repo.get_concepts_by_category(ConceptCategory.BASICS) == []
+    assert repo.get_concepts_by_category(ConceptCategory.OOP) == []
+    assert repo.search_concepts("concept") == []
+
+
+def test_replacing_concept_keeps_insertion_order():
+    repo = ConceptRepository()
+    repo.add_concept(make_concept("a"))
+    repo.add_concept(make_concept("b"))
+    repo.add_concept(make_concept("a", name="Concept a again"))
+
+    assert list(repo.concepts) == ["a", "b"]
+    assert ids(repo.get_concepts_by_level(SkillLevel.BEGINNER)) == ["a", "b"]
+    assert ids(repo.get_concepts_by_category(ConceptCategory.BASICS)) == ["a", "b"]
+    assert ids(repo.search_concepts("concept")) == ["a", "b"]
+
+
+def test_replacing_concept_level_keeps_repository_order():
+    repo = ConceptRepository()
+    repo.add_concept(make_concept("a"))
+    repo.add_concept(make_concept("b", SkillLevel.EXPERT))
+    repo.add_concept(make_concept("a", SkillLevel.EXPERT))
+
+    assert ids(repo.get_concepts_by_level(SkillLevel.EXPERT)) == ["a", "b"]
+
+
+def test_replacing_learning_path_keeps_insertion_order():
+    repo = ConceptRepository()
+    for path_id in ("p1", "p2", "p1"):
+        repo.add_learning_path(LearningPath(path_id, path_id, SkillLevel.BEGINNER, "Path", ["a"], 1))
+
+    assert [path.id for path in repo.get_learning_paths_by_level(SkillLevel.BEGINNER)] == ["p1", "p2"]
+
+
+def test_search_matches_name_description_and_keywords():
+    repo = ConceptRepository()
+    repo.add_concept(make_concept("a", name="Loops", description="Repeat work", keywords=["For Loop"]))
+    repo.add_concept(make_concept("b", name="Functions", description="Reuse code"))
+
+    assert ids(repo.search_concepts("LOOP")) == ["a"]
+    assert ids(repo.search_concepts("reuse")) == ["b"]
+    assert ids(repo.search_concepts("for loop")) == ["a"]
+    assert repo.search_concepts("missing") == []
+
+
+def test_indexed_keywords_cannot_go_stale():
+    repo = ConceptRepository()
+    concept = make_concept("a", keywords=["loops"])
+    repo.add_concept(concept)
+
+    assert concept.keywords == ("loops",)
+    with pytest.raises(AttributeError):
+        concept.keywords.append("zzzunique")
+    repo.add_concept(dataclasses.replace(concept, keywords=[*concept.keywords, "zzzunique"]))
+
+    assert ids(repo.search_concepts("zzzunique")) == ["a"]
+
+
+def test_learning_path_progress():
+    path = LearningPath("p", "Path", SkillLevel.BEGINNER, "Path", ["a", "b", "c", "d"], 1)
+
+    assert path.get_next_concept(["a", "b"]) == "c"
+    assert path.get_next_concept({"a", "b", "c", "d"}) is None
+    assert path.get_progress_percentage(["a", "b"]) == 50.0
+    assert path.get_progress_percentage(iter(["a"])) == 25.0
+    assert json.dumps(dataclasses.asdict(path), default=str)
+
+
+def test_to_dict_matches_asdict():
+    concept = create_sample_concepts().get_concept("python_variables_beginner")
+
+    assert concept.to_dict() == dataclasses.asdict(concept)
+    assert concept.to_dict()["code_examples"][0]["code"].startswith("name =")
+    assert not hasattr(concept, "__dict__")
+
+
+def test_save_and_load_round_trip(tmp_path):
+    repo = create_sample_concepts()
+    repo.add_concept(make_concept("a", SkillLevel.EXPERT, ConceptCategory.OOP, keywords=["classes"]))
+    snapshot = tmp_path / "concepts.pkl"
+
+    repo.save(snapshot)
+    loaded = ConceptRepository.load(snapshot)
+
+    assert loaded.concepts == repo.concepts
+    assert loaded.learning_paths == repo.learning_paths
+    assert list(loaded.concepts) == list(repo.concepts)
+    assert ids(loaded.get_concepts_by_level(SkillLevel.EXPERT)) == ["a"]
+    assert ids(loaded.get_concepts_by_category(ConceptCategory.BASICS, SkillLevel.BEGINNER)) == [
+        "python_variables_beginner"
+    ]
+    assert ids(loaded.search_concepts("classes")) == ["a"]
+    assert [path.id for path in loaded.get_learning_paths_by_level(SkillLevel.BEGINNER)] == ["python_beginner_path"]